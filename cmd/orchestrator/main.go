@@ -26,18 +26,21 @@ func main() {
 	if err != nil {
 		log.Fatalf("❌ Config error: %v", err)
 	}
-	log.Printf("⚙️  Config: %d workers, model=%s (%s)",
-		cfg.MaxWorkers, cfg.WhisperModel, cfg.WhisperDevice)
+	log.Printf("⚙️  Config: %d workers, model=%s (%s, %s)",
+		cfg.MaxWorkers, cfg.WhisperModel, cfg.WhisperDevice, cfg.WhisperComputeType)
 
 	// Connect to RabbitMQ
-	conn, err := rabbitmq.Connect(cfg.RabbitMQURL)
+	conn, err := rabbitmq.Connect(cfg.RabbitMQURL, rabbitmq.SocketBuffers{
+		Send:    cfg.SocketSndBuf,
+		Receive: cfg.SocketRcvBuf,
+	})
 	if err != nil {
 		log.Fatalf("❌ RabbitMQ: %v", err)
 	}
 	defer conn.Close()
 
 	// Create consumer and producer
-	consumer, err := rabbitmq.NewConsumer(conn, cfg.MaxWorkers)
+	consumer, err := rabbitmq.NewConsumer(conn, cfg.PrefetchCount)
 	if err != nil {
 		log.Fatalf("❌ Consumer: %v", err)
 	}
@@ -57,9 +60,8 @@ func main() {
 	defer processPool.Shutdown()
 
 	// Start worker pool
-	workerPool := worker.NewPool(processPool, producer, cfg.MaxWorkers)
+	workerPool := worker.NewPool(processPool, producer, cfg.MaxWorkers, cfg.MaxFileSizeMB)
 	workerPool.Start()
-	defer workerPool.Shutdown()
 
 	// Start consuming
 	jobs, err := consumer.Consume()
@@ -83,4 +85,11 @@ func main() {
 	// Wait for shutdown signal
 	<-shutdown
 	log.Println("\n🛑 Shutting down...")
+
+	// Stop new deliveries, then let in-flight jobs finish before the
+	// deferred process pool and connection teardown
+	if err := consumer.Cancel(); err != nil {
+		log.Printf("⚠️  Consumer cancel: %v", err)
+	}
+	workerPool.Shutdown(cfg.ShutdownTimeout)
 }
@@ -11,11 +11,15 @@ import (
 // Config holds all application configuration.
 type Config struct {
 	// RabbitMQ
-	RabbitMQURL string
+	RabbitMQURL   string
+	PrefetchCount int
+	SocketSndBuf  int
+	SocketRcvBuf  int
 
 	// Worker Pool
 	MaxWorkers         int
 	ProcessIdleTimeout time.Duration
+	ShutdownTimeout    time.Duration
 
 	// Python
 	PythonPath   string
@@ -25,11 +29,17 @@ type Config struct {
 	WhisperModel       string
 	WhisperDevice      string
 	WhisperComputeType string
+	WhisperBatchSize   int
+	WhisperCPUThreads  int
+	WhisperCPUs        string
+	WhisperWarmup      bool
+	ResultCacheSize    int
 	ModelsDir          string
 
 	// Audio (passed to Python via env)
 	MaxFileSizeMB      int
 	MaxAudioDurationSec int
+	MinAudioDurationSec float64
 	AudioSampleRate    int
 	TmpDir             string
 }
@@ -48,12 +58,39 @@ func Load() (*Config, error) {
 	}
 	cfg.MaxWorkers = maxWorkers
 
+	// Default keeps one extra delivery buffered per worker so the next job
+	// is already local when a worker finishes
+	prefetchCount, err := strconv.Atoi(getEnv("RABBITMQ_PREFETCH_COUNT", strconv.Itoa(maxWorkers*2)))
+	if err != nil {
+		return nil, fmt.Errorf("invalid RABBITMQ_PREFETCH_COUNT: %w", err)
+	}
+	cfg.PrefetchCount = prefetchCount
+
+	// 0 leaves the kernel defaults (and autotuning) in place
+	sndBuf, err := strconv.Atoi(getEnv("RABBITMQ_SO_SNDBUF", "0"))
+	if err != nil {
+		return nil, fmt.Errorf("invalid RABBITMQ_SO_SNDBUF: %w", err)
+	}
+	cfg.SocketSndBuf = sndBuf
+
+	rcvBuf, err := strconv.Atoi(getEnv("RABBITMQ_SO_RCVBUF", "0"))
+	if err != nil {
+		return nil, fmt.Errorf("invalid RABBITMQ_SO_RCVBUF: %w", err)
+	}
+	cfg.SocketRcvBuf = rcvBuf
+
 	idleTimeoutMin, err := strconv.Atoi(getEnv("PROCESS_IDLE_TIMEOUT_MIN", "5"))
 	if err != nil {
 		return nil, fmt.Errorf("invalid PROCESS_IDLE_TIMEOUT_MIN: %w", err)
 	}
 	cfg.ProcessIdleTimeout = time.Duration(idleTimeoutMin) * time.Minute
 
+	shutdownTimeoutSec, err := strconv.Atoi(getEnv("SHUTDOWN_TIMEOUT_SEC", "30"))
+	if err != nil {
+		return nil, fmt.Errorf("invalid SHUTDOWN_TIMEOUT_SEC: %w", err)
+	}
+	cfg.ShutdownTimeout = time.Duration(shutdownTimeoutSec) * time.Second
+
 	// Python
 	cfg.PythonPath = getEnv("PYTHON_PATH", "/usr/bin/python3")
 	cfg.WorkerScript = getEnv("WORKER_SCRIPT", "/app/python/worker.py")
@@ -61,9 +98,31 @@ func Load() (*Config, error) {
 	// Whisper
 	cfg.WhisperModel = getEnv("WHISPER_MODEL", "base")
 	cfg.WhisperDevice = getEnv("WHISPER_DEVICE", "cpu")
-	cfg.WhisperComputeType = getEnv("WHISPER_COMPUTE_TYPE", "int8")
+	cfg.WhisperComputeType = getEnv("WHISPER_COMPUTE_TYPE", defaultComputeType(cfg.WhisperDevice))
 	cfg.ModelsDir = getEnv("MODELS_DIR", "./models")
 
+	batchSize, err := strconv.Atoi(getEnv("WHISPER_BATCH_SIZE", "0"))
+	if err != nil {
+		return nil, fmt.Errorf("invalid WHISPER_BATCH_SIZE: %w", err)
+	}
+	cfg.WhisperBatchSize = batchSize
+
+	// 0 leaves the thread count to CTranslate2 (or one per pinned CPU)
+	cpuThreads, err := strconv.Atoi(getEnv("WHISPER_CPU_THREADS", "0"))
+	if err != nil {
+		return nil, fmt.Errorf("invalid WHISPER_CPU_THREADS: %w", err)
+	}
+	cfg.WhisperCPUThreads = cpuThreads
+
+	cfg.WhisperCPUs = getEnv("WHISPER_CPUS", "")
+	cfg.WhisperWarmup = getEnv("WHISPER_WARMUP", "1") == "1"
+
+	resultCacheSize, err := strconv.Atoi(getEnv("WHISPER_RESULT_CACHE_SIZE", "64"))
+	if err != nil {
+		return nil, fmt.Errorf("invalid WHISPER_RESULT_CACHE_SIZE: %w", err)
+	}
+	cfg.ResultCacheSize = resultCacheSize
+
 	// Audio
 	maxFileSizeMB, err := strconv.Atoi(getEnv("MAX_FILE_SIZE_MB", "100"))
 	if err != nil {
@@ -77,6 +136,12 @@ func Load() (*Config, error) {
 	}
 	cfg.MaxAudioDurationSec = maxDuration
 
+	minDuration, err := strconv.ParseFloat(getEnv("MIN_AUDIO_DURATION_SEC", "0"), 64)
+	if err != nil {
+		return nil, fmt.Errorf("invalid MIN_AUDIO_DURATION_SEC: %w", err)
+	}
+	cfg.MinAudioDurationSec = minDuration
+
 	sampleRate, err := strconv.Atoi(getEnv("AUDIO_SAMPLE_RATE", "16000"))
 	if err != nil {
 		return nil, fmt.Errorf("invalid AUDIO_SAMPLE_RATE: %w", err)
@@ -88,6 +153,23 @@ func Load() (*Config, error) {
 	return cfg, nil
 }
 
+// defaultComputeType picks int8 weights with float16 activations on GPU
+// and plain int8 on CPU.
+func defaultComputeType(device string) string {
+	if device == "cuda" {
+		return "int8_float16"
+	}
+	return "int8"
+}
+
+// boolEnv renders a flag the way the Python side reads it ("1" or "0").
+func boolEnv(v bool) string {
+	if v {
+		return "1"
+	}
+	return "0"
+}
+
 // getEnv returns the value of an environment variable or a default value.
 func getEnv(key, defaultValue string) string {
 	if value, exists := os.LookupEnv(key); exists {
@@ -99,12 +181,19 @@ func getEnv(key, defaultValue string) string {
 // GetPythonEnv returns environment variables to pass to Python processes.
 func (c *Config) GetPythonEnv() []string {
 	return []string{
+		fmt.Sprintf("WORKERS_COUNT=%d", c.MaxWorkers),
 		fmt.Sprintf("WHISPER_MODEL=%s", c.WhisperModel),
 		fmt.Sprintf("WHISPER_DEVICE=%s", c.WhisperDevice),
 		fmt.Sprintf("WHISPER_COMPUTE_TYPE=%s", c.WhisperComputeType),
+		fmt.Sprintf("WHISPER_BATCH_SIZE=%d", c.WhisperBatchSize),
+		fmt.Sprintf("WHISPER_CPU_THREADS=%d", c.WhisperCPUThreads),
+		fmt.Sprintf("WHISPER_CPUS=%s", c.WhisperCPUs),
+		fmt.Sprintf("WHISPER_WARMUP=%s", boolEnv(c.WhisperWarmup)),
+		fmt.Sprintf("WHISPER_RESULT_CACHE_SIZE=%d", c.ResultCacheSize),
 		fmt.Sprintf("MODELS_DIR=%s", c.ModelsDir),
 		fmt.Sprintf("MAX_FILE_SIZE_MB=%d", c.MaxFileSizeMB),
 		fmt.Sprintf("MAX_AUDIO_DURATION_SEC=%d", c.MaxAudioDurationSec),
+		fmt.Sprintf("MIN_AUDIO_DURATION_SEC=%g", c.MinAudioDurationSec),
 		fmt.Sprintf("AUDIO_SAMPLE_RATE=%d", c.AudioSampleRate),
 		fmt.Sprintf("TMP_DIR=%s", c.TmpDir),
 	}
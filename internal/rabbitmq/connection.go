@@ -4,6 +4,7 @@ package rabbitmq
 import (
 	"fmt"
 	"log"
+	"net"
 	"time"
 
 	amqp "github.com/rabbitmq/amqp091-go"
@@ -13,15 +14,33 @@ const (
 	// Connection retry settings
 	maxRetries    = 10
 	retryInterval = 5 * time.Second
+
+	// Same values amqp.Dial uses
+	heartbeat   = 10 * time.Second
+	locale      = "en_US"
+	dialTimeout = 30 * time.Second
 )
 
+// SocketBuffers sets the kernel send/receive buffer sizes (bytes) of the
+// AMQP TCP socket. Zero keeps the OS default (and Linux autotuning).
+type SocketBuffers struct {
+	Send    int
+	Receive int
+}
+
 // Connect establishes a connection to RabbitMQ with retry logic.
-func Connect(url string) (*amqp.Connection, error) {
+func Connect(url string, buffers SocketBuffers) (*amqp.Connection, error) {
 	var conn *amqp.Connection
 	var err error
 
+	config := amqp.Config{
+		Heartbeat: heartbeat,
+		Locale:    locale,
+		Dial:      dialWithBuffers(buffers),
+	}
+
 	for i := 0; i < maxRetries; i++ {
-		conn, err = amqp.Dial(url)
+		conn, err = amqp.DialConfig(url, config)
 		if err == nil {
 			log.Println("📡 RabbitMQ connected")
 			return conn, nil
@@ -35,3 +54,34 @@ func Connect(url string) (*amqp.Connection, error) {
 
 	return nil, fmt.Errorf("failed to connect after %d attempts: %w", maxRetries, err)
 }
+
+// dialWithBuffers wraps the default dialer and applies the configured
+// socket buffer sizes before the AMQP handshake starts.
+func dialWithBuffers(buffers SocketBuffers) func(network, addr string) (net.Conn, error) {
+	dial := amqp.DefaultDial(dialTimeout)
+
+	return func(network, addr string) (net.Conn, error) {
+		conn, err := dial(network, addr)
+		if err != nil {
+			return nil, err
+		}
+
+		tcpConn, ok := conn.(*net.TCPConn)
+		if !ok {
+			return conn, nil
+		}
+
+		if buffers.Send > 0 {
+			if err := tcpConn.SetWriteBuffer(buffers.Send); err != nil {
+				log.Printf("⚠️  Could not set SO_SNDBUF: %v", err)
+			}
+		}
+		if buffers.Receive > 0 {
+			if err := tcpConn.SetReadBuffer(buffers.Receive); err != nil {
+				log.Printf("⚠️  Could not set SO_RCVBUF: %v", err)
+			}
+		}
+
+		return conn, nil
+	}
+}
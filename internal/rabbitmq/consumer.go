@@ -14,6 +14,8 @@ const (
 	MainQueue   = "whisper_transcriptions"
 	MainExchange = "whisper_exchange"
 	MainRoutingKey = "transcription.request"
+
+	consumerTag = "go-orchestrator"
 )
 
 // Consumer handles consuming messages from RabbitMQ.
@@ -42,7 +44,8 @@ func NewConsumer(conn *amqp.Connection, prefetchCount int) (*Consumer, error) {
 		return nil, err
 	}
 
-	// Set QoS - prefetch count equals number of workers
+	// Set QoS - prefetch above the worker count keeps the pool fed without a
+	// broker round-trip between jobs
 	if err := channel.Qos(prefetchCount, 0, false); err != nil {
 		channel.Close()
 		return nil, fmt.Errorf("failed to set QoS: %w", err)
@@ -100,7 +103,7 @@ func declareConsumerTopology(ch *amqp.Channel) error {
 func (c *Consumer) Consume() (<-chan Job, error) {
 	msgs, err := c.channel.Consume(
 		c.queue,          // queue
-		"go-orchestrator", // consumer tag
+		consumerTag,      // consumer tag
 		false,            // auto-ack (we'll manually ACK)
 		false,            // exclusive
 		false,            // no-local
@@ -143,6 +146,12 @@ func (c *Consumer) Consume() (<-chan Job, error) {
 	return jobs, nil
 }
 
+// Cancel stops new deliveries while keeping the channel open, so jobs in
+// flight can still be ACKed. Unacked prefetched messages are redelivered.
+func (c *Consumer) Cancel() error {
+	return c.channel.Cancel(consumerTag, false)
+}
+
 // Close closes the consumer channel.
 func (c *Consumer) Close() error {
 	if c.channel != nil {
@@ -2,9 +2,14 @@
 package rabbitmq
 
 import (
+	"context"
 	"encoding/json"
 	"fmt"
 	"log"
+	"strconv"
+	"sync"
+	"sync/atomic"
+	"time"
 
 	amqp "github.com/rabbitmq/amqp091-go"
 )
@@ -23,13 +28,22 @@ const (
 
 	// Max retries (2 retries = 3 total attempts)
 	MaxRetries = 2
+
+	// Max time to wait for the broker to confirm a publish
+	confirmTimeout = 10 * time.Second
 )
 
 // Producer handles publishing messages to RabbitMQ.
 type Producer struct {
 	conn    *amqp.Connection
+	mu      sync.Mutex // guards channel and tracker while they are reopened
 	channel *amqp.Channel
+	tracker *publishTracker
 	model   string
+
+	// Message IDs let a broker return be matched to its publish
+	msgPrefix string
+	msgSeq    atomic.Uint64
 }
 
 // NewProducer creates a new RabbitMQ producer.
@@ -45,15 +59,64 @@ func NewProducer(conn *amqp.Connection, whisperModel string) (*Producer, error)
 		return nil, err
 	}
 
+	tracker, err := setupPublishChannel(channel)
+	if err != nil {
+		channel.Close()
+		return nil, err
+	}
+
 	log.Printf("[Producer] Connected and ready")
 
 	return &Producer{
-		conn:    conn,
-		channel: channel,
-		model:   whisperModel,
+		conn:      conn,
+		channel:   channel,
+		tracker:   tracker,
+		model:     whisperModel,
+		msgPrefix: strconv.FormatInt(time.Now().UnixNano(), 36) + "-",
 	}, nil
 }
 
+// setupPublishChannel enables publisher confirms and return handling on a
+// freshly opened channel.
+func setupPublishChannel(ch *amqp.Channel) (*publishTracker, error) {
+	// Enable publisher confirms so a delivery is only ACKed once its
+	// result or retry is safely stored by the broker
+	if err := ch.Confirm(false); err != nil {
+		return nil, fmt.Errorf("failed to enable publisher confirms: %w", err)
+	}
+
+	// Publishes are mandatory: track anything the broker could not route
+	return newPublishTracker(ch), nil
+}
+
+// getChannel returns the publish channel, reopening it on the shared
+// connection if the broker closed it with a channel-level error.
+// Only the channel is replaced; the TCP connection is left untouched.
+func (p *Producer) getChannel() (*amqp.Channel, *publishTracker, error) {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	if !p.channel.IsClosed() {
+		return p.channel, p.tracker, nil
+	}
+
+	log.Printf("🔄 [Producer] Channel closed, reopening")
+
+	channel, err := p.conn.Channel()
+	if err != nil {
+		return nil, nil, fmt.Errorf("failed to reopen channel: %w", err)
+	}
+	tracker, err := setupPublishChannel(channel)
+	if err != nil {
+		channel.Close()
+		return nil, nil, err
+	}
+
+	p.channel = channel
+	p.tracker = tracker
+	return channel, tracker, nil
+}
+
 // declareProducerTopology declares exchanges and queues for producing.
 func declareProducerTopology(ch *amqp.Channel) error {
 	// === Results topology ===
@@ -146,11 +209,9 @@ func (p *Producer) PublishResult(result TranscriptionResult) error {
 		return fmt.Errorf("failed to marshal result: %w", err)
 	}
 
-	err = p.channel.Publish(
+	err = p.publish(
 		ResultsExchange,   // exchange
 		ResultsRoutingKey, // routing key
-		false,             // mandatory
-		false,             // immediate
 		amqp.Publishing{
 			ContentType:  "application/json",
 			DeliveryMode: amqp.Persistent,
@@ -174,11 +235,9 @@ func (p *Producer) PublishRetry(request TranscriptionRequest) error {
 		return fmt.Errorf("failed to marshal retry request: %w", err)
 	}
 
-	err = p.channel.Publish(
+	err = p.publish(
 		RetryExchange,   // exchange
 		RetryRoutingKey, // routing key
-		false,           // mandatory
-		false,           // immediate
 		amqp.Publishing{
 			ContentType:  "application/json",
 			DeliveryMode: amqp.Persistent,
@@ -195,6 +254,156 @@ func (p *Producer) PublishRetry(request TranscriptionRequest) error {
 	return nil
 }
 
+// publish sends a message and waits for its publisher confirm.
+// Workers publish concurrently on the shared channel, so their confirms
+// are in flight together and the broker acknowledges them in batches.
+// A message the broker returned as unroutable is reported as an error:
+// its confirm is still an ack, but nothing stored it.
+func (p *Producer) publish(exchange, routingKey string, msg amqp.Publishing) error {
+	channel, tracker, err := p.getChannel()
+	if err != nil {
+		return err
+	}
+
+	msg.MessageId = p.msgPrefix + strconv.FormatUint(p.msgSeq.Add(1), 10)
+	tracker.track(msg.MessageId)
+	defer tracker.forget(msg.MessageId)
+
+	ctx, cancel := context.WithTimeout(context.Background(), confirmTimeout)
+	defer cancel()
+
+	confirm, err := channel.PublishWithDeferredConfirmWithContext(
+		ctx,
+		exchange,   // exchange
+		routingKey, // routing key
+		true,       // mandatory
+		false,      // immediate
+		msg,
+	)
+	if err != nil {
+		return err
+	}
+
+	if err := waitConfirm(ctx, confirm); err != nil {
+		return err
+	}
+
+	if tracker.wasReturned(msg.MessageId, confirm.DeliveryTag) {
+		return fmt.Errorf("message returned by broker as unroutable")
+	}
+
+	return nil
+}
+
+// waitConfirm blocks until the broker acks or nacks a publish.
+func waitConfirm(ctx context.Context, confirm *amqp.DeferredConfirmation) error {
+	acked, err := confirm.WaitContext(ctx)
+	if err != nil {
+		return fmt.Errorf("no publisher confirm: %w", err)
+	}
+	if !acked {
+		return fmt.Errorf("message nacked by broker")
+	}
+	return nil
+}
+
+// publishTracker records which in-flight messages of one channel the
+// broker returned as unroutable.
+//
+// The broker sends basic.return before the ack of the same message and the
+// client dispatches both in that order. A single goroutine reads returns
+// and confirms, so once it has seen a message's confirm, any return for
+// that message has already been recorded.
+type publishTracker struct {
+	mu        sync.Mutex
+	cond      *sync.Cond
+	returned  map[string]bool // in-flight message ID -> returned
+	confirmed uint64          // highest delivery tag seen on NotifyPublish
+	closed    bool
+}
+
+// newPublishTracker starts tracking returns and confirms on a channel.
+func newPublishTracker(ch *amqp.Channel) *publishTracker {
+	t := &publishTracker{returned: make(map[string]bool)}
+	t.cond = sync.NewCond(&t.mu)
+
+	// The returns channel must be unbuffered: the client then cannot
+	// dispatch the ack that follows a return until run has taken it
+	go t.run(
+		ch.NotifyReturn(make(chan amqp.Return)),
+		ch.NotifyPublish(make(chan amqp.Confirmation)),
+	)
+
+	return t
+}
+
+// run records returns and confirms until the channel is closed.
+func (t *publishTracker) run(returns <-chan amqp.Return, confirms <-chan amqp.Confirmation) {
+	for returns != nil || confirms != nil {
+		select {
+		case ret, ok := <-returns:
+			if !ok {
+				returns = nil
+				continue
+			}
+
+			t.mu.Lock()
+			if _, tracked := t.returned[ret.MessageId]; tracked {
+				t.returned[ret.MessageId] = true
+			}
+			t.mu.Unlock()
+
+			log.Printf("⚠️  Unroutable message returned (%s/%s): %d %s",
+				ret.Exchange, ret.RoutingKey, ret.ReplyCode, ret.ReplyText)
+
+		case confirm, ok := <-confirms:
+			if !ok {
+				confirms = nil
+				continue
+			}
+
+			t.mu.Lock()
+			if confirm.DeliveryTag > t.confirmed {
+				t.confirmed = confirm.DeliveryTag
+			}
+			t.mu.Unlock()
+			t.cond.Broadcast()
+		}
+	}
+
+	t.mu.Lock()
+	t.closed = true
+	t.mu.Unlock()
+	t.cond.Broadcast()
+}
+
+// track registers a message before it is published.
+func (t *publishTracker) track(messageID string) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	t.returned[messageID] = false
+}
+
+// forget drops a message once its publish call is done with it.
+// A return that arrives later is ignored.
+func (t *publishTracker) forget(messageID string) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	delete(t.returned, messageID)
+}
+
+// wasReturned waits until the confirm for deliveryTag has been read, then
+// reports whether the message was returned as unroutable.
+func (t *publishTracker) wasReturned(messageID string, deliveryTag uint64) bool {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	for t.confirmed < deliveryTag && !t.closed {
+		t.cond.Wait()
+	}
+	return t.returned[messageID]
+}
+
 // PublishError publishes an error result when max retries exceeded.
 func (p *Producer) PublishError(attachmentID int, importBatchID *int, errorMessage string) error {
 	result := TranscriptionResult{
@@ -230,6 +439,9 @@ func ShouldRetry(retryCount int) bool {
 
 // Close closes the producer channel.
 func (p *Producer) Close() error {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
 	if p.channel != nil {
 		return p.channel.Close()
 	}
@@ -24,8 +24,9 @@ type TranscriptionResult struct {
 
 // PythonWorkerRequest is the request sent to Python worker via stdin.
 type PythonWorkerRequest struct {
-	AudioFilePath string `json:"audio_file_path"`
-	Language      string `json:"language,omitempty"`
+	AudioFilePath  string `json:"audio_file_path"`
+	Language       string `json:"language,omitempty"`
+	SkipValidation bool   `json:"skip_validation,omitempty"`
 }
 
 // PythonWorkerResponse is the response received from Python worker via stdout.
@@ -35,4 +36,12 @@ type PythonWorkerResponse struct {
 	Duration     float64 `json:"duration,omitempty"`
 	Model        string  `json:"model,omitempty"`
 	ErrorMessage string  `json:"error_message,omitempty"`
+	// Retryable is false when the input was rejected (e.g. duration out of
+	// range); unset means the failure may be transient
+	Retryable *bool `json:"retryable,omitempty"`
+}
+
+// IsRetryable reports whether a failed response should go through retries.
+func (r *PythonWorkerResponse) IsRetryable() bool {
+	return r.Retryable == nil || *r.Retryable
 }
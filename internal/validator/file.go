@@ -12,6 +12,15 @@ var SupportedAudioFormats = []string{
 	".opus", ".mp3", ".wav", ".m4a", ".ogg", ".flac", ".aac", ".wma",
 }
 
+// supportedAudioSet indexes SupportedAudioFormats for constant-time lookups.
+var supportedAudioSet = func() map[string]struct{} {
+	set := make(map[string]struct{}, len(SupportedAudioFormats))
+	for _, ext := range SupportedAudioFormats {
+		set[ext] = struct{}{}
+	}
+	return set
+}()
+
 // FileExists checks if a file exists at the given path.
 func FileExists(path string) bool {
 	info, err := os.Stat(path)
@@ -21,16 +30,21 @@ func FileExists(path string) bool {
 	return !info.IsDir()
 }
 
+// RegularFileSize returns the size of a regular file using a single stat call.
+// The boolean is false if the path does not exist or is a directory.
+func RegularFileSize(path string) (int64, bool) {
+	info, err := os.Stat(path)
+	if err != nil || info.IsDir() {
+		return 0, false
+	}
+	return info.Size(), true
+}
+
 // ValidateAudioExtension checks if the file has a supported audio extension.
 func ValidateAudioExtension(path string) bool {
 	ext := strings.ToLower(filepath.Ext(path))
-	
-	for _, validExt := range SupportedAudioFormats {
-		if ext == validExt {
-			return true
-		}
-	}
-	return false
+	_, ok := supportedAudioSet[ext]
+	return ok
 }
 
 // GetFileSize returns the size of a file in bytes.
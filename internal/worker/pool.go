@@ -19,16 +19,18 @@ type Pool struct {
 	wg          sync.WaitGroup
 	shutdown    chan struct{}
 	numWorkers  int
+	maxFileSize int64
 }
 
 // NewPool creates a new worker pool.
-func NewPool(processPool *ProcessPool, producer *rabbitmq.Producer, numWorkers int) *Pool {
+func NewPool(processPool *ProcessPool, producer *rabbitmq.Producer, numWorkers int, maxFileSizeMB int) *Pool {
 	return &Pool{
 		processPool: processPool,
 		producer:    producer,
 		jobs:        make(chan rabbitmq.Job, numWorkers*2),
 		shutdown:    make(chan struct{}),
 		numWorkers:  numWorkers,
+		maxFileSize: int64(maxFileSizeMB) * 1024 * 1024,
 	}
 }
 
@@ -42,8 +44,12 @@ func (p *Pool) Start() {
 }
 
 // Submit adds a job to the processing queue.
+// After Shutdown the job is dropped unacked, so RabbitMQ redelivers it.
 func (p *Pool) Submit(job rabbitmq.Job) {
-	p.jobs <- job
+	select {
+	case <-p.shutdown:
+	case p.jobs <- job:
+	}
 }
 
 // worker processes jobs from the queue.
@@ -51,6 +57,15 @@ func (p *Pool) worker(id int) {
 	defer p.wg.Done()
 
 	for {
+		// Prefer shutdown over buffered jobs: those were never started and
+		// are redelivered, so draining them would only delay the exit
+		select {
+		case <-p.shutdown:
+			log.Printf("[Worker-%d] Shutting down", id)
+			return
+		default:
+		}
+
 		select {
 		case <-p.shutdown:
 			log.Printf("[Worker-%d] Shutting down", id)
@@ -74,7 +89,8 @@ func (p *Pool) processJob(workerID int, job rabbitmq.Job) {
 	log.Printf("[W%d] Job #%d%s", workerID, request.AttachmentID, retryInfo)
 
 	// 1. Validate file exists
-	if !validator.FileExists(request.AudioFilePath) {
+	fileSize, exists := validator.RegularFileSize(request.AudioFilePath)
+	if !exists {
 		err := p.producer.PublishError(
 			request.AttachmentID,
 			request.ImportBatchID,
@@ -105,24 +121,46 @@ func (p *Pool) processJob(workerID int, job rabbitmq.Job) {
 		return
 	}
 
-	// 3. Execute Python worker — start processing timer
+	// 3. Validate file size
+	if fileSize > p.maxFileSize {
+		err := p.producer.PublishError(
+			request.AttachmentID,
+			request.ImportBatchID,
+			fmt.Sprintf("File size (%.2f MB) exceeds maximum allowed (%d MB)",
+				float64(fileSize)/1024/1024, p.maxFileSize/1024/1024),
+		)
+		if err != nil {
+			log.Printf("[W%d] ❌ Publish failed: %v", workerID, err)
+			job.Delivery.Nack(false, true)
+			return
+		}
+		job.Delivery.Ack(false)
+		return
+	}
+
+	// 4. Execute Python worker (file already validated) — start processing timer
 	start := time.Now()
 	response, err := p.processPool.Execute(request)
 	processingTimeMs := time.Since(start).Milliseconds()
 
-	// 4. Handle execution error
+	// 5. Handle execution error
 	if err != nil {
 		p.handleFailure(workerID, job, err.Error())
 		return
 	}
 
-	// 5. Handle Python error response
+	// 6. Handle Python error response; rejected audio is not retried
 	if !response.Success {
+		if !response.IsRetryable() {
+			log.Printf("[W%d] ❌ #%d rejected: %s", workerID, request.AttachmentID, response.ErrorMessage)
+			p.publishFailure(workerID, job, response.ErrorMessage)
+			return
+		}
 		p.handleFailure(workerID, job, response.ErrorMessage)
 		return
 	}
 
-	// 6. Success - publish result
+	// 7. Success - publish result
 	err = p.producer.PublishSuccess(
 		request.AttachmentID,
 		request.ImportBatchID,
@@ -160,6 +198,12 @@ func (p *Pool) handleFailure(workerID int, job rabbitmq.Job, errorMessage string
 
 	// Max retries exceeded
 	log.Printf("[W%d] ❌ #%d failed: %s", workerID, request.AttachmentID, errorMessage)
+	p.publishFailure(workerID, job, errorMessage)
+}
+
+// publishFailure publishes a final error result and ACKs the job.
+func (p *Pool) publishFailure(workerID int, job rabbitmq.Job, errorMessage string) {
+	request := job.Request
 
 	err := p.producer.PublishError(request.AttachmentID, request.ImportBatchID, errorMessage)
 	if err != nil {
@@ -170,9 +214,20 @@ func (p *Pool) handleFailure(workerID int, job rabbitmq.Job, errorMessage string
 	job.Delivery.Ack(false)
 }
 
-// Shutdown gracefully stops all workers.
-func (p *Pool) Shutdown() {
+// Shutdown stops workers from taking new jobs and waits up to timeout for
+// in-flight jobs to finish, so their work is not redone after a restart.
+func (p *Pool) Shutdown(timeout time.Duration) {
 	close(p.shutdown)
-	close(p.jobs)
-	p.wg.Wait()
+
+	done := make(chan struct{})
+	go func() {
+		p.wg.Wait()
+		close(done)
+	}()
+
+	select {
+	case <-done:
+	case <-time.After(timeout):
+		log.Printf("⚠️  Shutdown timeout (%v), abandoning in-flight jobs", timeout)
+	}
 }
@@ -27,6 +27,7 @@ type PythonProcess struct {
 	mu       sync.Mutex
 	busy     bool
 	alive    bool
+	stopping bool // stdin closed by the idle cleanup, exiting on its own
 	lastUsed time.Time
 }
 
@@ -35,6 +36,7 @@ type ProcessPool struct {
 	processes   []*PythonProcess
 	maxWorkers  int
 	idleTimeout time.Duration
+	stopTimeout time.Duration
 	pythonPath  string
 	workerScript string
 	pythonEnv   []string
@@ -48,6 +50,7 @@ func NewProcessPool(cfg *config.Config) (*ProcessPool, error) {
 	pool := &ProcessPool{
 		maxWorkers:   cfg.MaxWorkers,
 		idleTimeout:  cfg.ProcessIdleTimeout,
+		stopTimeout:  cfg.ShutdownTimeout,
 		pythonPath:   cfg.PythonPath,
 		workerScript: cfg.WorkerScript,
 		pythonEnv:    cfg.GetPythonEnv(),
@@ -76,8 +79,10 @@ func NewProcessPool(cfg *config.Config) (*ProcessPool, error) {
 func (p *ProcessPool) spawnProcess(id int) (*PythonProcess, error) {
 	cmd := exec.Command(p.pythonPath, p.workerScript)
 	
-	// Set environment variables for Python
+	// Set environment variables for Python; WORKER_ID lets each process
+	// pick its own share of WHISPER_CPUS
 	cmd.Env = append(os.Environ(), p.pythonEnv...)
+	cmd.Env = append(cmd.Env, fmt.Sprintf("WORKER_ID=%d", id))
 
 	stdin, err := cmd.StdinPipe()
 	if err != nil {
@@ -146,10 +151,11 @@ func (p *ProcessPool) Execute(request rabbitmq.TranscriptionRequest) (*rabbitmq.
 	}
 	defer p.releaseProcess(proc)
 
-	// Build Python request
+	// Build Python request (existence, extension and size are checked in Go)
 	pyRequest := rabbitmq.PythonWorkerRequest{
-		AudioFilePath: request.AudioFilePath,
-		Language:      request.Language,
+		AudioFilePath:  request.AudioFilePath,
+		Language:       request.Language,
+		SkipValidation: true,
 	}
 
 	// Send request JSON + newline
@@ -158,15 +164,16 @@ func (p *ProcessPool) Execute(request rabbitmq.TranscriptionRequest) (*rabbitmq.
 		return nil, fmt.Errorf("failed to marshal request: %w", err)
 	}
 
-	_, err = fmt.Fprintf(proc.stdin, "%s\n", requestJSON)
+	// Single write of the payload plus its newline, no fmt formatting
+	_, err = proc.stdin.Write(append(requestJSON, '\n'))
 	if err != nil {
 		// Process may be dead, mark for respawn
 		proc.alive = false
 		return nil, fmt.Errorf("failed to write to process: %w", err)
 	}
 
-	// Read response line
-	responseLine, err := proc.stdout.ReadString('\n')
+	// Read response line as bytes (no string round-trip before parsing)
+	responseLine, err := proc.stdout.ReadBytes('\n')
 	if err != nil {
 		proc.alive = false
 		return nil, fmt.Errorf("failed to read from process: %w", err)
@@ -174,7 +181,7 @@ func (p *ProcessPool) Execute(request rabbitmq.TranscriptionRequest) (*rabbitmq.
 
 	// Parse response
 	var response rabbitmq.PythonWorkerResponse
-	if err := json.Unmarshal([]byte(responseLine), &response); err != nil {
+	if err := json.Unmarshal(responseLine, &response); err != nil {
 		return nil, fmt.Errorf("failed to parse response: %w, raw: %s", err, responseLine)
 	}
 
@@ -243,7 +250,8 @@ func (p *ProcessPool) idleCleanupLoop() {
 	}
 }
 
-// cleanupIdleProcesses kills processes that have been idle too long.
+// cleanupIdleProcesses stops processes that have been idle too long.
+// They are stopped in the background so the pool stays usable meanwhile.
 func (p *ProcessPool) cleanupIdleProcesses() {
 	p.mu.Lock()
 	defer p.mu.Unlock()
@@ -251,15 +259,23 @@ func (p *ProcessPool) cleanupIdleProcesses() {
 	for _, proc := range p.processes {
 		proc.mu.Lock()
 		if !proc.busy && proc.alive && time.Since(proc.lastUsed) > p.idleTimeout {
-			log.Printf("💤 Killing idle Py%d", proc.id)
-			proc.cmd.Process.Kill()
+			log.Printf("💤 Stopping idle Py%d", proc.id)
 			proc.alive = false
+			proc.stopping = true
+
+			p.wg.Add(1)
+			go func(proc *PythonProcess) {
+				defer p.wg.Done()
+				proc.stop(p.stopTimeout)
+			}(proc)
 		}
 		proc.mu.Unlock()
 	}
 }
 
 // Shutdown gracefully shuts down all Python processes.
+// Each worker sees EOF on stdin, flushes its queued cleanups and exits;
+// workers still running after the stop timeout are killed.
 func (p *ProcessPool) Shutdown() {
 	close(p.shutdown)
 
@@ -267,11 +283,46 @@ func (p *ProcessPool) Shutdown() {
 	defer p.mu.Unlock()
 
 	for _, proc := range p.processes {
-		if proc != nil && proc.cmd != nil && proc.cmd.Process != nil {
-			proc.stdin.Close()
-			proc.cmd.Process.Kill()
-			proc.cmd.Wait()
+		if proc == nil || proc.cmd == nil || proc.cmd.Process == nil {
+			continue
 		}
+
+		proc.mu.Lock()
+		stopping := proc.stopping
+		proc.alive = false
+		proc.stopping = true
+		proc.mu.Unlock()
+
+		if !stopping {
+			p.wg.Add(1)
+			go func(proc *PythonProcess) {
+				defer p.wg.Done()
+				proc.stop(p.stopTimeout)
+			}(proc)
+		}
+	}
+
+	// Also waits for idle processes that were already being stopped
+	p.wg.Wait()
+}
+
+// stop closes the process's stdin and waits up to timeout for it to exit
+// before killing it.
+func (proc *PythonProcess) stop(timeout time.Duration) {
+	proc.stdin.Close()
+
+	exited := make(chan struct{})
+	go func() {
+		proc.cmd.Wait()
+		close(exited)
+	}()
+
+	select {
+	case <-exited:
+	case <-time.After(timeout):
+		log.Printf("⚠️  Py%d still running after %s, killing", proc.id, timeout)
+		proc.cmd.Process.Kill()
+		<-exited
 	}
 }
 
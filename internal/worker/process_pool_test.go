@@ -0,0 +1,95 @@
+package worker
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"whisper-local/internal/config"
+)
+
+// newTestPool starts a one-process pool running script under /bin/sh in
+// place of worker.py.
+func newTestPool(t *testing.T, script string, stopTimeout time.Duration) *ProcessPool {
+	t.Helper()
+
+	path := filepath.Join(t.TempDir(), "worker.sh")
+	if err := os.WriteFile(path, []byte(script), 0o644); err != nil {
+		t.Fatal(err)
+	}
+
+	pool, err := NewProcessPool(&config.Config{
+		MaxWorkers:         1,
+		ProcessIdleTimeout: time.Hour,
+		ShutdownTimeout:    stopTimeout,
+		PythonPath:         "/bin/sh",
+		WorkerScript:       path,
+	})
+	if err != nil {
+		t.Fatal(err)
+	}
+	return pool
+}
+
+func TestShutdownFlushesQueuedCleanups(t *testing.T) {
+	// Stands in for a file worker.py has queued for the cleanup thread
+	pending := filepath.Join(t.TempDir(), "consumed.ogg")
+	if err := os.WriteFile(pending, nil, 0o644); err != nil {
+		t.Fatal(err)
+	}
+
+	// Like worker.py: run until stdin hits EOF, then flush the cleanup
+	// queue before exiting
+	pool := newTestPool(t, `echo READY
+cat >/dev/null
+sleep 0.2
+rm -f '`+pending+`'
+`, 5*time.Second)
+
+	pool.Shutdown()
+
+	if _, err := os.Stat(pending); !os.IsNotExist(err) {
+		t.Fatalf("queued file not removed on shutdown (stat err: %v)", err)
+	}
+}
+
+func TestIdleCleanupFlushesQueuedCleanups(t *testing.T) {
+	pending := filepath.Join(t.TempDir(), "consumed.ogg")
+	if err := os.WriteFile(pending, nil, 0o644); err != nil {
+		t.Fatal(err)
+	}
+
+	pool := newTestPool(t, `echo READY
+cat >/dev/null
+sleep 0.2
+rm -f '`+pending+`'
+`, 5*time.Second)
+	pool.idleTimeout = 0
+
+	pool.cleanupIdleProcesses()
+	if stats := pool.Stats(); stats["alive"] != 0 {
+		t.Fatalf("idle worker still alive: %v", stats)
+	}
+
+	// Shutdown must wait for the idle stop instead of killing the process
+	pool.Shutdown()
+
+	if _, err := os.Stat(pending); !os.IsNotExist(err) {
+		t.Fatalf("queued file not removed after idle stop (stat err: %v)", err)
+	}
+}
+
+func TestShutdownKillsWorkerAfterStopTimeout(t *testing.T) {
+	// Ignores EOF on stdin
+	pool := newTestPool(t, `echo READY
+exec sleep 30
+`, 200*time.Millisecond)
+
+	start := time.Now()
+	pool.Shutdown()
+
+	if elapsed := time.Since(start); elapsed > 5*time.Second {
+		t.Fatalf("Shutdown took %s, want the worker killed after the stop timeout", elapsed)
+	}
+}
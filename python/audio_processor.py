@@ -1,36 +1,108 @@
 """
-Audio Processor - Validates and converts audio files for Whisper processing.
+Audio Processor - Validates and decodes audio files for Whisper processing.
 
 Standalone module without external app dependencies.
 Configuration loaded from environment variables.
 """
 import os
-import uuid
+import wave
+import queue
+import shutil
 import logging
+import threading
+import subprocess
 from pathlib import Path
-from pydub import AudioSegment
+from typing import Optional
+
+import av
+import numpy as np
+from faster_whisper.audio import decode_audio
+
+from errors import ProcessingError, ValidationError
 
 logger = logging.getLogger(__name__)
 
 # Configuration from environment variables
 MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB", "100"))
 MAX_AUDIO_DURATION_SEC = int(os.getenv("MAX_AUDIO_DURATION_SEC", "3600"))
+MIN_AUDIO_DURATION_SEC = float(os.getenv("MIN_AUDIO_DURATION_SEC", "0"))
 AUDIO_SAMPLE_RATE = int(os.getenv("AUDIO_SAMPLE_RATE", "16000"))
 TMP_DIR = os.getenv("TMP_DIR", "/tmp/whisper")
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+
+# Resolved once at import time; only used as a fallback decoder for inputs
+# PyAV (bundled with faster-whisper) rejects
+FFMPEG_BIN = shutil.which("ffmpeg")
+
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+# Set once TMP_DIR has been created by the first AudioProcessor
+_TMP_DIR_READY = False
+
+# Background deletion (see AudioProcessor.schedule_cleanup)
+_cleanup_queue: "queue.Queue[str]" = queue.Queue()
+_cleanup_thread: Optional[threading.Thread] = None
+
+
+def _pcm16_to_float32(pcm: bytes) -> np.ndarray:
+    """
+    Normalize 16-bit PCM bytes to float32 in a single vectorized pass.
+    
+    frombuffer is a zero-copy view; multiplying with a float32 output dtype
+    avoids the extra astype copy and any float64 intermediate.
+    """
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    return np.multiply(samples, _PCM16_SCALE, dtype=np.float32)
+
+
+def _run_tool(args: list, **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run an ffmpeg command with stdin detached from the worker pipe.
+    
+    close_fds=False lets CPython use its posix_spawn/vfork fast path instead
+    of walking the fd table in the child. Nothing leaks: Python creates its
+    own descriptors non-inheritable (PEP 446) and stdio is redirected here.
+    """
+    return subprocess.run(args, stdin=subprocess.DEVNULL, close_fds=False, **kwargs)
+
+
+def _remove_file(file_path: str) -> bool:
+    """Unlink a file, treating an already missing file as not deleted."""
+    # unlink reports a missing file itself, no separate exists() stat
+    try:
+        os.unlink(file_path)
+        return True
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Cleanup failed: %s", e)
+    return False
+
+
+def _cleanup_worker():
+    """Daemon loop: unlink queued paths, blocking until one arrives."""
+    while True:
+        path = _cleanup_queue.get()
+        _remove_file(path)
+        _cleanup_queue.task_done()
 
 
 class AudioProcessor:
     """
     Service for audio file validation and preprocessing.
-    Converts audio to the format required by Whisper (16kHz, mono WAV).
+    Decodes audio to the format required by Whisper (16kHz mono float32).
     """
     
-    # Supported audio formats
-    SUPPORTED_FORMATS = ['.opus', '.mp3', '.wav', '.m4a', '.ogg', '.flac', '.aac', '.wma']
+    # Supported audio formats (the tuple keeps a stable order for messages)
+    SUPPORTED_FORMATS_ORDERED = ('.opus', '.mp3', '.wav', '.m4a', '.ogg', '.flac', '.aac', '.wma')
+    SUPPORTED_FORMATS = frozenset(SUPPORTED_FORMATS_ORDERED)
     
     def __init__(self):
         """Initialize audio processor and ensure tmp directory exists."""
-        Path(TMP_DIR).mkdir(parents=True, exist_ok=True)
+        global _TMP_DIR_READY
+        if not _TMP_DIR_READY:
+            Path(TMP_DIR).mkdir(parents=True, exist_ok=True)
+            _TMP_DIR_READY = True
     
     def validate_file(self, file_path: str) -> dict:
         """
@@ -44,29 +116,29 @@ class AudioProcessor:
         
         Raises:
             FileNotFoundError: If file doesn't exist
-            ValueError: If file is invalid
+            ValidationError: If file is invalid
         """
-        path = Path(file_path)
-        
-        if not path.exists():
+        # A single stat covers both the existence and the size check
+        try:
+            file_size_bytes = os.stat(file_path).st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"Audio file not found: {file_path}")
         
         # Check file size
-        file_size_bytes = path.stat().st_size
-        max_size_bytes = MAX_FILE_SIZE_MB * 1024 * 1024
-        
-        if file_size_bytes > max_size_bytes:
-            raise ValueError(
+        if file_size_bytes > MAX_FILE_SIZE_BYTES:
+            raise ValidationError(
                 f"File size ({file_size_bytes / 1024 / 1024:.2f} MB) exceeds "
                 f"maximum allowed ({MAX_FILE_SIZE_MB} MB)"
             )
         
-        # Check file extension
-        file_extension = path.suffix.lower()
+        # Check file extension (only lowercase it when the exact match misses)
+        file_extension = os.path.splitext(file_path)[1]
         if file_extension not in self.SUPPORTED_FORMATS:
-            raise ValueError(
+            file_extension = file_extension.lower()
+        if file_extension not in self.SUPPORTED_FORMATS:
+            raise ValidationError(
                 f"Unsupported audio format: {file_extension}. "
-                f"Supported: {', '.join(self.SUPPORTED_FORMATS)}"
+                f"Supported: {', '.join(self.SUPPORTED_FORMATS_ORDERED)}"
             )
         
         return {
@@ -75,99 +147,173 @@ class AudioProcessor:
             "format": file_extension
         }
     
-    def get_audio_duration(self, file_path: str) -> float:
+    def quick_probe(self, file_path: str) -> Optional[float]:
         """
-        Get the duration of an audio file in seconds.
+        Read the container duration from its header, without any fallback.
+        
+        Opens the file in-process with PyAV, so no ffprobe process is
+        spawned; cheap enough to reject unusable audio before paying for
+        a full decode.
         
         Args:
             file_path: Path to the audio file
         
         Returns:
-            Duration in seconds
+            Duration in seconds, or None if the file cannot be opened or
+            the container does not report one
+        """
+        try:
+            with av.open(file_path, metadata_errors="ignore") as container:
+                if container.duration is not None:
+                    return container.duration / av.time_base
+                
+                # Some containers only carry the duration on the stream
+                stream = container.streams.audio[0]
+                if stream.duration is not None and stream.time_base:
+                    return float(stream.duration * stream.time_base)
+        except (av.error.FFmpegError, IndexError):
+            pass
+        return None
+    
+    def _check_duration(self, duration_seconds: float):
+        """
+        Validate a duration against the configured limits.
         
         Raises:
-            RuntimeError: If audio cannot be loaded
+            ValidationError: If the audio is too long or too short
         """
-        try:
-            audio = AudioSegment.from_file(file_path)
-            duration_seconds = len(audio) / 1000.0
-            return duration_seconds
-        except Exception as e:
-            logger.error(f"Failed to get audio duration: {e}")
-            raise RuntimeError(f"Could not load audio file: {str(e)}")
+        if duration_seconds > MAX_AUDIO_DURATION_SEC:
+            raise ValidationError(
+                f"Audio duration ({duration_seconds:.2f}s) exceeds "
+                f"maximum allowed ({MAX_AUDIO_DURATION_SEC}s)"
+            )
+        
+        if duration_seconds < MIN_AUDIO_DURATION_SEC:
+            raise ValidationError(
+                f"Audio duration ({duration_seconds:.2f}s) is below "
+                f"minimum allowed ({MIN_AUDIO_DURATION_SEC}s)"
+            )
     
-    def convert_to_wav(self, file_path: str) -> str:
+    def decode_to_numpy(self, file_path: str) -> np.ndarray:
         """
-        Convert audio file to 16kHz mono WAV format.
+        Decode an audio file straight into a mono float32 array.
+        
+        Decoding and resampling run in-process through PyAV (libavcodec +
+        libswresample), so no ffmpeg process is spawned, no WAV file is
+        written and faster-whisper does not have to decode it again. The
+        ffmpeg CLI is kept as a fallback for inputs PyAV rejects.
         
         Args:
             file_path: Path to the input audio file
         
         Returns:
-            Path to the converted WAV file
+            Samples in [-1.0, 1.0) at AUDIO_SAMPLE_RATE
         
         Raises:
-            RuntimeError: If conversion fails
+            ProcessingError: If decoding fails
         """
         try:
-            # Load audio
-            audio = AudioSegment.from_file(file_path)
-            
-            # Convert to mono and resample to 16kHz
-            audio = audio.set_channels(1)
-            audio = audio.set_frame_rate(AUDIO_SAMPLE_RATE)
-            
-            # Generate output path
-            output_filename = f"{uuid.uuid4()}.wav"
-            output_path = os.path.join(TMP_DIR, output_filename)
+            # Already 16-bit mono at the target rate: no decode needed
+            pcm = self._read_conformant_wav(file_path)
+            if pcm is not None:
+                return _pcm16_to_float32(pcm)
             
-            # Export as WAV
-            audio.export(output_path, format="wav")
+            try:
+                return decode_audio(file_path, sampling_rate=AUDIO_SAMPLE_RATE)
+            except Exception as e:
+                if not FFMPEG_BIN:
+                    raise
+                logger.debug("PyAV decode failed, retrying with ffmpeg: %s", e)
             
-            return output_path
+            return _pcm16_to_float32(self._ffmpeg_decode(file_path))
             
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="replace").strip()
+            logger.error("Failed to decode audio: %s", stderr)
+            raise ProcessingError(f"Audio decoding failed: {stderr}")
         except Exception as e:
-            logger.error(f"Failed to convert audio: {e}")
-            raise RuntimeError(f"Audio conversion failed: {str(e)}")
+            logger.error("Failed to decode audio: %s", e)
+            raise ProcessingError(f"Audio decoding failed: {str(e)}")
+    
+    def _read_conformant_wav(self, file_path: str) -> Optional[bytes]:
+        """
+        Return the raw PCM of a WAV that already matches Whisper's input
+        format (16-bit PCM, mono, AUDIO_SAMPLE_RATE), or None otherwise.
+        
+        Only the header is inspected before deciding, so non-conformant
+        files cost a single open.
+        """
+        if not file_path.lower().endswith(".wav"):
+            return None
+        
+        try:
+            with wave.open(file_path, "rb") as wav:
+                if (
+                    wav.getnchannels() != 1
+                    or wav.getsampwidth() != 2
+                    or wav.getframerate() != AUDIO_SAMPLE_RATE
+                ):
+                    return None
+                return wav.readframes(wav.getnframes())
+        except (wave.Error, EOFError):
+            # Compressed/float/extensible WAVs go through PyAV
+            return None
+    
+    def _ffmpeg_decode(self, file_path: str) -> bytes:
+        """Decode to 16-bit mono PCM on stdout and return the raw bytes."""
+        result = _run_tool(
+            [
+                FFMPEG_BIN, "-nostdin",
+                "-hide_banner", "-loglevel", "error",
+                "-i", file_path,
+                "-f", "s16le",
+                "-acodec", "pcm_s16le",
+                "-ac", "1",
+                "-ar", str(AUDIO_SAMPLE_RATE),
+                "-",
+            ],
+            capture_output=True,
+            check=True,
+        )
+        return result.stdout
     
-    def process_audio(self, file_path: str) -> str:
+    def process_audio_to_array(self, file_path: str, skip_validation: bool = False) -> np.ndarray:
         """
-        Complete audio processing pipeline: validate, check duration, convert.
+        Complete processing pipeline: validate, decode, check duration.
+        
+        A metadata probe rejects out-of-range audio before any decoding; the
+        exact duration is then checked on the decoded samples. Nothing is
+        written to disk.
         
         Args:
             file_path: Path to the input audio file
+            skip_validation: Skip validate_file when the caller has already
+                checked existence, size and extension
         
         Returns:
-            Path to the processed WAV file
+            Mono float32 samples at AUDIO_SAMPLE_RATE
         
         Raises:
             FileNotFoundError: If file doesn't exist
-            ValueError: If validation fails
-            RuntimeError: If processing fails
+            ValidationError: If validation fails
+            ProcessingError: If processing fails
         """
         # Step 1: Validate file
-        self.validate_file(file_path)
-        
-        # Step 2: Load and check duration
-        audio = AudioSegment.from_file(file_path)
-        duration_seconds = len(audio) / 1000.0
+        if not skip_validation:
+            self.validate_file(file_path)
         
-        if duration_seconds > MAX_AUDIO_DURATION_SEC:
-            raise ValueError(
-                f"Audio duration ({duration_seconds:.2f}s) exceeds "
-                f"maximum allowed ({MAX_AUDIO_DURATION_SEC}s)"
-            )
+        # Step 2: Reject out-of-range audio from metadata, before decoding
+        probed_duration = self.quick_probe(file_path)
+        if probed_duration is not None:
+            self._check_duration(probed_duration)
         
-        # Step 3: Convert to 16kHz mono WAV
-        audio = audio.set_channels(1)
-        audio = audio.set_frame_rate(AUDIO_SAMPLE_RATE)
+        # Step 3: Decode to 16kHz mono samples
+        audio = self.decode_to_numpy(file_path)
         
-        output_filename = f"{uuid.uuid4()}.wav"
-        output_path = os.path.join(TMP_DIR, output_filename)
+        # Step 4: Check the exact duration of the decoded audio
+        self._check_duration(len(audio) / AUDIO_SAMPLE_RATE)
         
-        audio.export(output_path, format="wav")
-        
-        return output_path
+        return audio
     
     def cleanup(self, file_path: str) -> bool:
         """
@@ -179,10 +325,43 @@ class AudioProcessor:
         Returns:
             True if deleted, False otherwise
         """
-        try:
-            if file_path and os.path.exists(file_path):
-                os.remove(file_path)
-                return True
-        except Exception as e:
-            logger.warning(f"Cleanup failed: {e}")
-        return False
+        if not file_path:
+            return False
+        return _remove_file(file_path)
+    
+    def schedule_cleanup(self, file_path: str):
+        """
+        Queue a file for deletion on the background cleanup thread.
+        
+        Returns immediately, so the unlink is not part of the request
+        latency. The thread is started on first use.
+        
+        Args:
+            file_path: Path to the file to delete
+        """
+        global _cleanup_thread
+        if not file_path:
+            return
+        
+        if _cleanup_thread is None:
+            _cleanup_thread = threading.Thread(
+                target=_cleanup_worker, name="audio-cleanup", daemon=True
+            )
+            _cleanup_thread.start()
+        
+        _cleanup_queue.put(file_path)
+    
+    def flush_cleanup(self):
+        """
+        Delete every file still queued for background cleanup, synchronously.
+        
+        Called on shutdown: the cleanup thread is a daemon and would be
+        killed with pending deletions still queued.
+        """
+        while True:
+            try:
+                path = _cleanup_queue.get_nowait()
+            except queue.Empty:
+                return
+            _remove_file(path)
+            _cleanup_queue.task_done()
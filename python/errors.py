@@ -0,0 +1,22 @@
+"""
+Shared exception types for the Python worker.
+
+Standalone module without external app dependencies.
+"""
+
+
+class ProcessingError(RuntimeError):
+    """
+    A request failed in AudioProcessor or WhisperService.
+    
+    Raised only after the cause (decoder output, model error) has been
+    logged, so the worker reports it without logging it again.
+    """
+
+
+class ValidationError(ValueError):
+    """
+    The input audio was rejected by a size, format or duration limit.
+    
+    Deterministic, so the worker reports it as not retryable.
+    """
@@ -6,22 +6,56 @@ Configuration loaded from environment variables.
 The model is loaded once when the service starts and kept in memory.
 """
 import os
+import time
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.vad import get_speech_timestamps
+
+from errors import ProcessingError
 
 logger = logging.getLogger(__name__)
 
 # Configuration from environment variables
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
 WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "cpu")
-WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
+# int8 weights with float16 activations on GPU, plain int8 on CPU
+WHISPER_COMPUTE_TYPE = os.getenv(
+    "WHISPER_COMPUTE_TYPE",
+    "int8_float16" if WHISPER_DEVICE == "cuda" else "int8"
+)
 MODELS_DIR = os.getenv("MODELS_DIR", "./models")
+# > 0 enables batched inference over VAD segments (mainly useful on GPU)
+WHISPER_BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "0"))
+# CPU threads per model; 0 lets CTranslate2 choose. With several worker
+# processes per host, keep WORKERS_COUNT x threads <= physical cores
+WHISPER_CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", "0"))
+# CPU list the worker pool is pinned to (see worker.pin_cpus)
+WHISPER_CPUS = os.getenv("WHISPER_CPUS", "")
+# Run a dummy inference at startup ("0" disables it)
+WHISPER_WARMUP = os.getenv("WHISPER_WARMUP", "1") == "1"
 
 # Global model instance (singleton)
 _model: Optional[WhisperModel] = None
+_pipeline: Optional[BatchedInferencePipeline] = None
+_service: Optional["WhisperService"] = None
+
+
+def _cpu_threads() -> int:
+    """
+    Resolve the CTranslate2 thread count.
+    
+    An explicit WHISPER_CPU_THREADS wins; otherwise a worker pinned with
+    WHISPER_CPUS uses one thread per CPU it was given.
+    """
+    if WHISPER_CPU_THREADS > 0:
+        return WHISPER_CPU_THREADS
+    if WHISPER_CPUS and hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return 0
 
 
 class WhisperService:
@@ -36,39 +70,76 @@ class WhisperService:
         if _model is None:
             self._load_model()
         self.model = _model
+        self.pipeline = _pipeline
     
     def _load_model(self):
         """
         Load the Whisper model into memory.
         Called once when the service is first instantiated.
         """
-        global _model
+        global _model, _pipeline
         
         try:
-            logger.info(f"Loading {WHISPER_MODEL} on {WHISPER_DEVICE}...")
+            logger.info(
+                "Loading %s on %s (%s)...",
+                WHISPER_MODEL, WHISPER_DEVICE, WHISPER_COMPUTE_TYPE
+            )
             
             _model = WhisperModel(
                 WHISPER_MODEL,
                 device=WHISPER_DEVICE,
                 compute_type=WHISPER_COMPUTE_TYPE,
+                cpu_threads=_cpu_threads(),
                 download_root=MODELS_DIR
             )
             
+            if WHISPER_BATCH_SIZE > 0:
+                _pipeline = BatchedInferencePipeline(model=_model)
+            
         except Exception as e:
-            logger.error(f"Failed to load Whisper model: {e}")
+            logger.error("Failed to load Whisper model: %s", e)
             raise RuntimeError(f"Could not initialize Whisper model: {str(e)}")
     
+    def warmup(self):
+        """
+        Run one short dummy inference so the first real request does not
+        pay for lazy backend initialization (allocator, kernels, caches).
+        
+        The Silero VAD model used by vad_filter is loaded here too. It is
+        run on its own because silence filtered by VAD would never reach
+        the decoder. Disabled with WHISPER_WARMUP=0.
+        
+        Failures are logged and ignored; the model itself is already loaded.
+        """
+        if not WHISPER_WARMUP:
+            return
+        
+        start = time.perf_counter()
+        try:
+            silence = np.zeros(16000, dtype=np.float32)
+            get_speech_timestamps(silence)
+            segments, _ = self.model.transcribe(silence, language="en", beam_size=1)
+            # Segments are generated lazily; consume them to run the decoder
+            for _ in segments:
+                pass
+        except Exception as e:
+            logger.warning("Warmup failed: %s", e)
+            return
+        
+        logger.info("Warmup done in %.2fs", time.perf_counter() - start)
+    
     def transcribe(
         self,
-        audio_path: str,
+        audio: Union[str, np.ndarray],
         language: Optional[str] = None,
         task: str = "transcribe"
     ) -> dict:
         """
-        Transcribe an audio file to text.
+        Transcribe audio to text.
         
         Args:
-            audio_path: Path to the audio file (should be preprocessed to 16kHz WAV)
+            audio: Path to the audio file (should be preprocessed to 16kHz WAV)
+                or a mono float32 array already sampled at 16kHz
             language: Optional language code (e.g., 'es', 'en'). If None, auto-detect
             task: Either 'transcribe' or 'translate' (to English)
         
@@ -80,32 +151,41 @@ class WhisperService:
         
         Raises:
             FileNotFoundError: If audio file doesn't exist
-            RuntimeError: If transcription fails
+            ProcessingError: If transcription fails
         """
-        if not Path(audio_path).exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if isinstance(audio, str) and not Path(audio).exists():
+            raise FileNotFoundError(f"Audio file not found: {audio}")
         
         if self.model is None:
-            raise RuntimeError("Whisper model not loaded")
+            logger.error("Whisper model not loaded")
+            raise ProcessingError("Whisper model not loaded")
+        
+        options = dict(
+            language=language,
+            task=task,
+            beam_size=5,
+            vad_filter=True,
+            vad_parameters=dict(
+                min_silence_duration_ms=500
+            )
+        )
         
         try:
             # Transcribe with faster-whisper
-            segments, info = self.model.transcribe(
-                audio_path,
-                language=language,
-                task=task,
-                beam_size=5,
-                vad_filter=True,
-                vad_parameters=dict(
-                    min_silence_duration_ms=500
+            if self.pipeline is not None:
+                # Batched: VAD chunks of this audio are decoded together
+                segments, info = self.pipeline.transcribe(
+                    audio,
+                    batch_size=WHISPER_BATCH_SIZE,
+                    **options
                 )
-            )
+            else:
+                segments, info = self.model.transcribe(audio, **options)
             
-            # Concatenate all segments
-            full_text = " ".join(segment.text.strip() for segment in segments)
-            
-            # Clean up text (remove extra spaces)
-            full_text = " ".join(full_text.split())
+            # Concatenate all segments, skipping empty ones so no extra
+            # spaces are produced and no second cleanup pass is needed
+            parts = [t for t in (segment.text.strip() for segment in segments) if t]
+            full_text = " ".join(parts)
             
             return {
                 "text": full_text,
@@ -116,8 +196,8 @@ class WhisperService:
             }
             
         except Exception as e:
-            logger.error(f"Transcription failed: {e}")
-            raise RuntimeError(f"Transcription failed: {str(e)}")
+            logger.error("Transcription failed: %s", e)
+            raise ProcessingError(f"Transcription failed: {str(e)}")
     
     def get_model_info(self) -> dict:
         """
@@ -131,5 +211,19 @@ class WhisperService:
             "device": WHISPER_DEVICE,
             "compute_type": WHISPER_COMPUTE_TYPE,
             "models_dir": MODELS_DIR,
+            "batch_size": WHISPER_BATCH_SIZE,
+            "cpu_threads": _cpu_threads(),
             "loaded": self.model is not None
         }
+
+
+def get_whisper_service() -> WhisperService:
+    """
+    Return the process-wide WhisperService, creating it on first use.
+    
+    Later calls return the same instance without running __init__ again.
+    """
+    global _service
+    if _service is None:
+        _service = WhisperService()
+    return _service
@@ -10,15 +10,31 @@ Persistent worker process that:
 
 Communication protocol:
 - Startup: prints "READY" to stdout when initialized
-- Request: JSON line on stdin {"audio_file_path": "...", "language": "..."}
+- Request: JSON line on stdin {"audio_file_path": "...", "language": "...", "skip_validation": true}
 - Response: JSON line on stdout {"success": true/false, ...}
 """
+import gc
 import sys
 import json
 import logging
 import signal
-import select
+import selectors
+import hashlib
 import os
+from collections import OrderedDict
+from typing import Optional
+
+# orjson parses bytes and encodes to bytes in C; its JSONDecodeError
+# subclasses json.JSONDecodeError, so error handling is the same for both
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 # Configure logging to stderr (stdout is for communication with Go)
 logging.basicConfig(
@@ -30,15 +46,102 @@ logger = logging.getLogger(__name__)
 
 # Import local modules
 from audio_processor import AudioProcessor
-from whisper_service import WhisperService
+from errors import ProcessingError, ValidationError
+from whisper_service import get_whisper_service
 
 # Idle timeout in seconds (also controlled by Go)
 IDLE_TIMEOUT = int(os.getenv("PROCESS_IDLE_TIMEOUT_SEC", "300"))  # 5 minutes
 
+# CPU pinning: WHISPER_CPUS (e.g. "0-7" or "0,2,4") is split evenly
+# between the WORKERS_COUNT processes; Go sets WORKER_ID for each one
+WHISPER_CPUS = os.getenv("WHISPER_CPUS", "")
+WORKER_ID = int(os.getenv("WORKER_ID", "0"))
+WORKERS_COUNT = int(os.getenv("WORKERS_COUNT", "1"))
+
+# Transcriptions kept per process, keyed by decoded audio + language ("0" disables)
+RESULT_CACHE_SIZE = int(os.getenv("WHISPER_RESULT_CACHE_SIZE", "64"))
+_result_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+
 # Global services (initialized once)
 audio_processor = None
 whisper_service = None
 
+# Raw stdio for the JSON-lines protocol: stdin is read with os.read and
+# split by read_line, so no text layer, codec or BufferedReader is involved
+_stdin_fd = sys.stdin.fileno()
+_stdout = sys.stdout.buffer
+_stdout_fd = sys.stdout.fileno()
+
+
+def write_line(payload: bytes):
+    """
+    Write payload plus newline to stdout in a single syscall.
+    
+    os.writev sends both buffers without concatenating them or going
+    through Python's buffered writer, so no flush is needed. A short write
+    (e.g. interrupted by a signal) is completed with os.write.
+    """
+    if not hasattr(os, "writev"):
+        _stdout.write(payload + b"\n")
+        _stdout.flush()
+        return
+    
+    written = os.writev(_stdout_fd, [payload, b"\n"])
+    if written < len(payload) + 1:
+        remaining = memoryview(payload + b"\n")[written:]
+        while remaining:
+            remaining = remaining[os.write(_stdout_fd, remaining):]
+
+
+def send(message: dict):
+    """Write one JSON line to stdout for Go."""
+    write_line(_json_dumps(message))
+
+
+def parse_cpu_list(spec: str) -> list:
+    """Parse a Linux-style CPU list such as "0-3,6" into [0, 1, 2, 3, 6]."""
+    cpus = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            cpus.extend(range(int(first), int(last) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def pin_cpus():
+    """
+    Pin this process to its share of WHISPER_CPUS and mark it SCHED_BATCH.
+    
+    Each worker gets a contiguous slice of the list, so the processes do
+    not migrate across each other's cores and caches. SCHED_BATCH tells
+    the scheduler the process is CPU-bound and not latency-sensitive.
+    Linux only; a no-op when WHISPER_CPUS is unset.
+    """
+    if not WHISPER_CPUS or not hasattr(os, "sched_setaffinity"):
+        return
+    
+    try:
+        cpus = parse_cpu_list(WHISPER_CPUS)
+        if not cpus:
+            return
+        
+        workers = max(WORKERS_COUNT, 1)
+        start = WORKER_ID * len(cpus) // workers
+        end = (WORKER_ID + 1) * len(cpus) // workers
+        # More workers than CPUs: share them round-robin
+        share = cpus[start:end] or [cpus[WORKER_ID % len(cpus)]]
+        
+        os.sched_setaffinity(0, share)
+        os.sched_setscheduler(0, os.SCHED_BATCH, os.sched_param(0))
+        logger.info("📌 Pinned to CPUs %s", ",".join(map(str, share)))
+    except (ValueError, OSError) as e:
+        logger.warning("⚠️  CPU pinning failed: %s", e)
+
 
 def init_services():
     """Initialize services and load Whisper model."""
@@ -46,38 +149,71 @@ def init_services():
     
     logger.info("🔧 Initializing...")
     audio_processor = AudioProcessor()
-    whisper_service = WhisperService()
+    whisper_service = get_whisper_service()
+    whisper_service.warmup()
+    
+    # Everything allocated so far lives for the whole process: move it out
+    # of the collector's reach, and collect young objects less often so
+    # collections do not interrupt inference
+    gc.collect()
+    gc.freeze()
+    gc.set_threshold(100000, 50, 10)
+    
     logger.info("✅ Model loaded")
 
 
+def transcribe_cached(audio, language) -> dict:
+    """
+    Transcribe decoded audio, reusing the result for identical input.
+    
+    The key is a BLAKE2b digest of the 16kHz samples plus the language, so
+    the same recording resubmitted under another path is still a hit.
+    Hashing costs milliseconds; a cache hit skips the whole inference.
+    """
+    if RESULT_CACHE_SIZE <= 0:
+        return whisper_service.transcribe(audio=audio, language=language)
+    
+    key = (hashlib.blake2b(audio, digest_size=16).digest(), language)
+    result = _result_cache.get(key)
+    if result is not None:
+        _result_cache.move_to_end(key)
+        return result
+    
+    result = whisper_service.transcribe(audio=audio, language=language)
+    _result_cache[key] = result
+    if len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+    return result
+
+
 def process_request(request: dict) -> dict:
     """
     Process a single transcription request.
     
     Args:
-        request: Dict with 'audio_file_path' and optional 'language'
+        request: Dict with 'audio_file_path' and optional 'language' and
+            'skip_validation' (set by Go once it has validated the file)
     
     Returns:
-        Dict with 'success', 'texto', 'duration', 'model' or 'error_message'
+        Dict with 'success', 'texto', 'duration', 'model' or
+        'error_message' (plus 'retryable': False for rejected input)
     """
-    processed_wav_path = None
-    
     try:
         audio_file_path = request["audio_file_path"]
         language = request.get("language")
+        skip_validation = request.get("skip_validation", False)
         
-        # Step 1: Validate and convert audio to 16kHz WAV
-        processed_wav_path = audio_processor.process_audio(audio_file_path)
-        
-        # Step 2: Transcribe with Whisper
-        result = whisper_service.transcribe(
-            audio_path=processed_wav_path,
-            language=language
+        # Step 1: Validate and decode audio to 16kHz samples in memory
+        audio = audio_processor.process_audio_to_array(
+            audio_file_path,
+            skip_validation=skip_validation
         )
         
-        # Step 3: Cleanup temporary files
-        audio_processor.cleanup(processed_wav_path)
-        audio_processor.cleanup(audio_file_path)
+        # Step 2: Transcribe with Whisper (or reuse a cached result)
+        result = transcribe_cached(audio, language)
+        
+        # Step 3: Delete the consumed input file off the request path
+        audio_processor.schedule_cleanup(audio_file_path)
         
         return {
             "success": True,
@@ -92,45 +228,87 @@ def process_request(request: dict) -> dict:
             "error_message": f"File not found: {str(e)}"
         }
         
-    except ValueError as e:
-        # Cleanup on validation error
-        if processed_wav_path:
-            audio_processor.cleanup(processed_wav_path)
+    except ValidationError as e:
+        # Rejected input: retrying cannot change the outcome
         return {
             "success": False,
-            "error_message": f"Validation error: {str(e)}"
+            "error_message": f"Validation error: {str(e)}",
+            "retryable": False
+        }
+        
+    except ProcessingError as e:
+        # Raised by AudioProcessor/WhisperService, which already logged
+        # the cause (ffmpeg stderr, decoder or model error)
+        return {
+            "success": False,
+            "error_message": f"Processing error: {str(e)}"
         }
         
     except Exception as e:
-        logger.error(f"❌ {type(e).__name__}: {str(e)}")
+        logger.error("❌ %s: %s", type(e).__name__, e)
         return {
             "success": False,
             "error_message": f"Processing error: {str(e)}"
         }
 
 
+def read_line(selector, buf: bytearray) -> Optional[bytes]:
+    """
+    Return the next line from stdin, without its newline.
+    
+    Complete lines are split out of buf with bytearray.find (a C memchr).
+    stdin is only read, with os.read, when buf holds no complete line, so
+    the selector never waits while a request is already buffered.
+    
+    Args:
+        selector: Selector with stdin registered, or None to block on read
+        buf: Bytes read but not yet consumed; kept across calls
+    
+    Returns:
+        The line, or None on EOF or idle timeout
+    """
+    while True:
+        newline = buf.find(b"\n")
+        if newline != -1:
+            line = bytes(buf[:newline])
+            del buf[:newline + 1]
+            return line
+        
+        if selector is not None and not selector.select(IDLE_TIMEOUT):
+            logger.info("💤 Idle timeout, exiting")
+            return None
+        
+        chunk = os.read(_stdin_fd, 65536)
+        if not chunk:
+            if not buf:
+                return None
+            # EOF after an unterminated last line: still hand it out
+            chunk = b"\n"
+        buf += chunk
+
+
 def main_loop():
     """
     Main processing loop.
     
     Reads JSON requests from stdin, processes them, and writes responses to stdout.
-    Uses select() for timeout-based idle detection on Linux.
+    Uses a selector (epoll on Linux) for timeout-based idle detection.
     """
+    # Registered once for the life of the process; Windows selectors only
+    # handle sockets, so there the idle timeout is left to Go
+    selector = None
+    if sys.platform != 'win32':
+        selector = selectors.DefaultSelector()
+        selector.register(_stdin_fd, selectors.EVENT_READ)
+    
+    buf = bytearray()
     while True:
         try:
-            # Wait for input with timeout (for idle detection)
-            # On Linux, we use select() for timeout on stdin
-            if sys.platform != 'win32':
-                ready, _, _ = select.select([sys.stdin], [], [], IDLE_TIMEOUT)
-                
-                if not ready:
-                    logger.info("💤 Idle timeout, exiting")
-                    break
+            # Read line from stdin (bytes; json.loads accepts them as-is),
+            # waiting at most IDLE_TIMEOUT for it
+            line = read_line(selector, buf)
             
-            # Read line from stdin
-            line = sys.stdin.readline()
-            
-            if not line:
+            if line is None:
                 break
             
             line = line.strip()
@@ -139,34 +317,37 @@ def main_loop():
             
             # Parse JSON request
             try:
-                request = json.loads(line)
+                request = _json_loads(line)
             except json.JSONDecodeError as e:
-                response = {
+                send({
                     "success": False,
                     "error_message": f"Invalid JSON input: {str(e)}"
-                }
-                print(json.dumps(response), flush=True)
+                })
                 continue
             
             # Process request
             response = process_request(request)
             
             # Write response (single JSON line)
-            print(json.dumps(response), flush=True)
+            send(response)
             
         except KeyboardInterrupt:
             break
         except Exception as e:
-            logger.error(f"❌ Unexpected: {e}")
-            response = {
+            logger.error("❌ Unexpected: %s", e)
+            send({
                 "success": False,
                 "error_message": f"Worker error: {str(e)}"
-            }
-            print(json.dumps(response), flush=True)
+            })
 
 
 def handle_sigterm(signum, frame):
-    """Handle SIGTERM signal for graceful shutdown."""
+    """
+    Handle SIGTERM signal for graceful shutdown.
+    
+    Only raises SystemExit; pending cleanups are flushed by main's finally
+    block once the stack has unwound, never from inside the handler.
+    """
     sys.exit(0)
 
 
@@ -178,19 +359,27 @@ def main():
         signal.signal(signal.SIGPIPE, signal.SIG_DFL)
     
     try:
+        # Pin before the model creates its thread pool
+        pin_cpus()
+        
         # Initialize services and load model
         init_services()
         
         # Signal to Go that we're ready
-        print("READY", flush=True)
+        write_line(b"READY")
         
         # Enter main processing loop
         main_loop()
         
     except Exception as e:
-        logger.error(f"❌ Fatal: {e}")
+        logger.error("❌ Fatal: %s", e)
         sys.exit(1)
     
+    finally:
+        # Delete consumed inputs still queued for the cleanup thread
+        if audio_processor is not None:
+            audio_processor.flush_cleanup()
+    
     sys.exit(0)
 
 